@@ -1,76 +1,141 @@
 import logging
 import asyncio
-from datetime import timedelta
 
-from aiorinnai import async_get_api
+from aiorinnai.api import API
+from aiohttp import ClientError, ClientResponseError
 from aiorinnai.errors import RequestError
+from botocore.exceptions import BotoCoreError, ClientError as BotoClientError
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_PASSWORD, 
     CONF_EMAIL,
-    MAJOR_VERSION,
-    MINOR_VERSION,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.components.water_heater import DOMAIN as WATER_HEATER_DOMAIN
 
 from .const import (
     CLIENT,
+    CLIENTS,
+    CLIENTS_LOCK,
     DOMAIN,
-    CONF_UNIT,
-    DEFAULT_UNIT,
-    CONF_MAINT_INTERVAL_ENABLED,
-    DEFAULT_MAINT_INTERVAL_ENABLED,
+    DEFAULT_OPTIONS,
+    TOKEN_LOCKS,
 )
 from .device import RinnaiDeviceDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["water_heater","binary_sensor", "sensor"]
+PLATFORMS: tuple[str, ...] = ("water_heater", "binary_sensor", "sensor")
 
-def is_min_ha_version(min_ha_major_ver: int, min_ha_minor_ver: int) -> bool:
-    """Check if HA version at least a specific version."""
+# Attempts at reaching the cloud before handing the retry back to Home Assistant
+SETUP_ATTEMPTS = 3
+
+# The Cognito login goes through aioboto3 and fails with botocore errors,
+# while the GraphQL requests fail with aiorinnai's RequestError
+CLOUD_ERRORS = (
+    RequestError,
+    BotoCoreError,
+    BotoClientError,
+    ClientError,
+    asyncio.TimeoutError,
+)
+
+# Cognito error codes meaning the account's credentials were rejected
+AUTH_ERROR_CODES = frozenset(("NotAuthorizedException", "UserNotFoundException"))
+
+async def async_get_client(hass: HomeAssistant, email: str, password: str):
+    """Return an authenticated API client, reusing one cached for the account.
+
+    The config flow and every entry setup go through here. The setup that
+    follows the flow, and any later reload (for example after an options
+    change), can therefore skip the Cognito login entirely. The client
+    renews its own tokens once they expire.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    lock = domain_data.setdefault(CLIENTS_LOCK, asyncio.Lock())
+    async with lock:
+        clients = domain_data.setdefault(CLIENTS, {})
+        cached = clients.get(email)
+        if cached is not None and cached[0] == password:
+            return cached[1]
+        # async_get_api drops the session argument, so build the client here
+        # to keep its requests on Home Assistant's pooled connections
+        client = API(email, password, session=async_get_clientsession(hass))
+        await client._get_initial_token()
+        clients[email] = (password, client)
+        return client
+
+
+def is_auth_error(err: Exception) -> bool:
+    """Return whether Cognito rejected the account's credentials."""
     return (
-        MAJOR_VERSION > min_ha_major_ver or
-        (MAJOR_VERSION == min_ha_major_ver and MINOR_VERSION >= min_ha_minor_ver)
+        isinstance(err, BotoClientError)
+        and err.response.get("Error", {}).get("Code") in AUTH_ERROR_CODES
     )
 
 
+def _is_transient(err: Exception) -> bool:
+    """Return whether a failed cloud request is worth retrying right away."""
+    if isinstance(err, BotoClientError):
+        status = err.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return status is None or status >= 500
+    cause = err if isinstance(err, ClientResponseError) else err.__cause__
+    return not (isinstance(cause, ClientResponseError) and cause.status < 500)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Rinnai from config entry"""
-    session = async_get_clientsession(hass)
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {}
+    email = entry.data[CONF_EMAIL]
+    entry_data = hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {}
+
+    for attempt in range(SETUP_ATTEMPTS):
+        try:
+            async with asyncio.timeout(30):
+                entry_data[CLIENT] = client = await async_get_client(
+                    hass, email, entry.data[CONF_PASSWORD]
+                )
+                user_info = await client.user.get_info()
+            break
+        except CLOUD_ERRORS as err:
+            if is_auth_error(err):
+                raise ConfigEntryAuthFailed from err
+            if attempt == SETUP_ATTEMPTS - 1 or not _is_transient(err):
+                raise ConfigEntryNotReady from err
+            _LOGGER.debug("Retrying Rinnai setup after transient error: %s", err)
+            await asyncio.sleep(0.5 * 2**attempt)
 
-    try:
-        hass.data[DOMAIN][entry.entry_id][CLIENT] = client = await async_get_api(
-            entry.data[CONF_EMAIL], entry.data[CONF_PASSWORD], session=session
-        )
-    except RequestError as err:
-        raise ConfigEntryNotReady from err
+    _LOGGER.debug("Rinnai user information: %s", user_info)
 
-    user_info = await client.user.get_info()
+    if not entry.options:
+        # Entries created before options existed; the update listener is not
+        # registered yet, so this does not trigger a reload.
+        hass.config_entries.async_update_entry(entry, options=dict(DEFAULT_OPTIONS))
 
-    _LOGGER.debug("Rinnai user information: %s", user_info)
+    # Remembered so unrelated entry updates do not trigger a reload
+    entry_data["options"] = entry.options
+
+    # Devices of one account share its client, and so its token renewal
+    token_lock = hass.data[DOMAIN].setdefault(TOKEN_LOCKS, {}).setdefault(
+        email, asyncio.Lock()
+    )
 
-    hass.data[DOMAIN][entry.entry_id]["devices"] = devices = [
-        RinnaiDeviceDataUpdateCoordinator(hass, client, device["id"], entry.options)
-        for device in user_info["devices"]["items"]
+    # Keyed by id so a device listed twice does not get two coordinators
+    listing = {device["id"]: device for device in user_info["devices"]["items"]}
+    entry_data["devices"] = devices = [
+        RinnaiDeviceDataUpdateCoordinator(
+            hass, client, device_id, entry.options, token_lock
+        )
+        for device_id in listing
     ]
 
-    if not entry.options:
-        await _async_options_updated(hass, entry)
-    
-    tasks = [device.async_refresh() for device in devices]
-    await asyncio.gather(*tasks)
+    # The user listing returns the same fields as getDevice, so it serves as
+    # every device's first poll instead of one more request per device
+    for device in devices:
+        device.async_seed(listing[device.id])
 
-    if is_min_ha_version(2022,8):
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    else:
-        hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     
@@ -78,6 +143,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry):
     """Update options."""
+    if entry.options == hass.data[DOMAIN][entry.entry_id]["options"]:
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -85,4 +152,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the cached API client when the entry is deleted."""
+    domain_data = hass.data.get(DOMAIN, {})
+    domain_data.get(CLIENTS, {}).pop(entry.data[CONF_EMAIL], None)
+    domain_data.get(TOKEN_LOCKS, {}).pop(entry.data[CONF_EMAIL], None)
\ No newline at end of file
@@ -1,60 +1,75 @@
 """Support for Rinnai Water Heater binary sensors."""
 from __future__ import annotations
-from distutils.util import strtobool
+
+from collections.abc import Callable
+from dataclasses import dataclass
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
+from homeassistant.core import callback
 
 from .const import DOMAIN as RINNAI_DOMAIN
 from .device import RinnaiDeviceDataUpdateCoordinator
 from .entity import RinnaiEntity
 
+@dataclass(frozen=True, kw_only=True)
+class RinnaiBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a Rinnai binary sensor."""
+
+    value_fn: Callable[[RinnaiDeviceDataUpdateCoordinator], bool]
+    icons: tuple[str, str]
+
+BINARY_SENSOR_TYPES: tuple[RinnaiBinarySensorEntityDescription, ...] = (
+    RinnaiBinarySensorEntityDescription(
+        key="recirculation",
+        translation_key="recirculation",
+        value_fn=lambda device: device.is_recirculating,
+        icons=("mdi:circle-off-outline", "mdi:autorenew"),
+    ),
+    RinnaiBinarySensorEntityDescription(
+        key="water_heater_heating",
+        translation_key="water_heater_heating",
+        value_fn=lambda device: device.is_heating,
+        icons=("mdi:fire-off", "mdi:fire"),
+    ),
+)
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the Flo sensors from config entry."""
     devices: list[RinnaiDeviceDataUpdateCoordinator] = hass.data[RINNAI_DOMAIN][
         config_entry.entry_id
     ]["devices"]
-    entities = []
-    for device in devices:
-        entities.append(RinnaiIsRecirculatingBinarySensor(device))
-        entities.append(RinnaiIsHeatingBinarySensor(device))
-    async_add_entities(entities)
+    async_add_entities(
+        RinnaiBinarySensor(device, description)
+        for device in devices
+        for description in BINARY_SENSOR_TYPES
+    )
 
-class RinnaiIsRecirculatingBinarySensor(RinnaiEntity, BinarySensorEntity):
-    """Binary sensor that reports if water is detected (for leak detectors)."""
+class RinnaiBinarySensor(RinnaiEntity, BinarySensorEntity):
+    """Binary sensor that reports a Rinnai device state."""
 
-    def __init__(self, device):
-        """Initialize the binary sensors."""
-        super().__init__("recirculation", "Water Heater Recirculation", device)
-        
-    @property
-    def icon(self):
-        """Return the icon"""
-        if self.is_on:
-            return "mdi:autorenew"
-        return "mdi:circle-off-outline"
-
-    @property
-    def is_on(self):
-        """Return true if the Rinnai device is recirculating water."""
-        return self._device.is_recirculating
-
-class RinnaiIsHeatingBinarySensor(RinnaiEntity, BinarySensorEntity):
-    """Binary sensor that reports if water is detected (for leak detectors)."""
-
-    def __init__(self, device):
+    _attr_has_entity_name = True
+
+    entity_description: RinnaiBinarySensorEntityDescription
+
+    def __init__(self, device, description: RinnaiBinarySensorEntityDescription):
         """Initialize the binary sensors."""
-        super().__init__("water_heater_heating", f"{device.device_name} Water Heater Heating", device)
-        
-    @property
-    def icon(self):
-        """Return the icon"""
-        if self.is_on:
-            return "mdi:fire"
-        return "mdi:fire-off"
-
-    @property
-    def is_on(self):
-        """Return true if the Rinnai device is recirculating water."""
-        return self._device.is_heating
\ No newline at end of file
+        super().__init__(description.key, None, device)
+        self.entity_description = description
+        self._set_state(description.value_fn(device))
+
+    def _set_state(self, is_on: bool) -> None:
+        """Cache the state and the icon that goes with it."""
+        self._attr_is_on = is_on
+        self._attr_icon = self.entity_description.icons[bool(is_on)]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when this sensor's value changed."""
+        is_on = self.entity_description.value_fn(self.coordinator)
+        changed = is_on != self._attr_is_on
+        if changed:
+            self._set_state(is_on)
+        self._async_write_if_changed(changed)
@@ -1,18 +1,17 @@
 """Config flow for Rinnai integration."""
-from aiorinnai import async_get_api
-from aiorinnai.errors import RequestError
 import voluptuous as vol
 
 from homeassistant import config_entries, core, exceptions
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.core import callback
 
+from . import CLOUD_ERRORS, async_get_client, is_auth_error
 from .const import (
     DOMAIN,
     LOGGER,
     CONF_MAINT_INTERVAL_ENABLED,
     DEFAULT_MAINT_INTERVAL_ENABLED,
+    DEFAULT_OPTIONS,
 )
 
 DATA_SCHEMA = vol.Schema({vol.Required("email"): str, vol.Required("password"): str})
@@ -22,19 +21,20 @@ async def validate_input(hass: core.HomeAssistant, data):
     Data has the keys from DATA_SCHEMA with values provided by the user.
     """
 
-    session = async_get_clientsession(hass)
     try:
-        api = await async_get_api(
-            data[CONF_EMAIL], data[CONF_PASSWORD], session=session
-        )
-    except RequestError as request_error:
+        # Cached for the entry setup that follows, so it does not have to
+        # authenticate a second time
+        api = await async_get_client(hass, data[CONF_EMAIL], data[CONF_PASSWORD])
+    except CLOUD_ERRORS as request_error:
+        if is_auth_error(request_error):
+            raise InvalidAuth from request_error
         LOGGER.error("Error connecting to the Rinnai API: %s", request_error)
         raise CannotConnect from request_error
 
     user_info = await api.user.get_info()
-    first_device_name = user_info["devices"]["items"][0]["id"]
-    device_info = await api.device.get_info(first_device_name)
-    return {"title": device_info["data"]["getDevice"]["device_name"]}
+    # The user listing already carries each device's details
+    first_device = user_info["devices"]["items"][0]
+    return {"title": first_device["device_name"]}
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Rinnai."""
@@ -52,17 +52,44 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(
                     title=info["title"],
                     data=user_input,
-                    options={
-                        CONF_MAINT_INTERVAL_ENABLED: DEFAULT_MAINT_INTERVAL_ENABLED,
-                    },
+                    options=dict(DEFAULT_OPTIONS),
                 )
             except CannotConnect:
                 errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
 
         return self.async_show_form(
             step_id="user", data_schema=DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_reauth(self, entry_data):
+        """Handle the account's password being rejected during setup."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(self, user_input=None):
+        """Ask for the account's current password."""
+        errors = {}
+        if user_input is not None:
+            data = {**self._reauth_entry.data, CONF_PASSWORD: user_input[CONF_PASSWORD]}
+            try:
+                await validate_input(self.hass, data)
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            else:
+                return self.async_update_reload_and_abort(self._reauth_entry, data=data)
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            errors=errors,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -91,4 +118,7 @@ class OptionsFlow(config_entries.OptionsFlow):
         )
 
 class CannotConnect(exceptions.HomeAssistantError):
-    """Error to indicate we cannot connect."""
\ No newline at end of file
+    """Error to indicate we cannot connect."""
+
+class InvalidAuth(exceptions.HomeAssistantError):
+    """Error to indicate the credentials were rejected."""
\ No newline at end of file
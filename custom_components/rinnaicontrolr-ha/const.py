@@ -5,6 +5,9 @@ LOGGER = logging.getLogger(__package__)
 
 DOMAIN = 'rinnai'
 CLIENT = "client"
+CLIENTS = "clients"
+CLIENTS_LOCK = "clients_lock"
+TOKEN_LOCKS = "token_locks"
 
 ATTRIBUTION = "Data provided by Rinnai"
 
@@ -14,6 +17,10 @@ CONF_UNIT = "units"
 CONF_MAINT_INTERVAL_ENABLED = "maint_interval_enabled"
 DEFAULT_MAINT_INTERVAL_ENABLED = True
 
+DEFAULT_OPTIONS = {
+    CONF_MAINT_INTERVAL_ENABLED: DEFAULT_MAINT_INTERVAL_ENABLED,
+}
+
 CONF_UNITS = ["celsius", "fahrenheit"]
 
 ATTR_CACHE = 'cache'
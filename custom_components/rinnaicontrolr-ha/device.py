@@ -1,18 +1,20 @@
 """Rinnai device object"""
+from __future__ import annotations
+
 import asyncio
-from cmath import log
+from dataclasses import dataclass, replace
+from functools import cached_property
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
-from distutils.util import strtobool
 
 from aiorinnai.api import API
 from aiorinnai.errors import RequestError
 from async_timeout import timeout
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.util.dt as dt_util
-from homeassistant.util import Throttle
 
 from .const import (
 	CONF_MAINT_INTERVAL_ENABLED,
@@ -22,46 +24,159 @@ from .const import (
 )
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=5)
+UPDATE_INTERVAL = timedelta(seconds=60)
+# Delay before confirming a command with a poll: long enough for the heater
+# to report the change to the cloud, and back-to-back commands share it
+COMMAND_REFRESH_COOLDOWN = 10.0
+
+# Shared by every device so setup and scheduled polls never hit the Rinnai
+# cloud with more than a few requests at once
+_POLL_SEMAPHORE = asyncio.Semaphore(4)
+
+# Renew the shared client's token this long before aiorinnai would notice it
+# expired, so concurrent polls do not each start their own login
+TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
+
+async def _async_ensure_token(client: API, lock: asyncio.Lock) -> None:
+	"""Renew an expiring token once on behalf of every device of the account"""
+	async with lock:
+		expires_at = client.token.get("expires_at")
+		if expires_at is None or datetime.now() < expires_at - TOKEN_REFRESH_MARGIN:
+			return
+		LOGGER.debug("Renewing Rinnai access token ahead of expiry")
+		await client._refresh_token()
+
+_TRUE_STRINGS = frozenset(("y", "yes", "t", "true", "on", "1"))
+
+def _as_bool(value: Any) -> bool:
+	"""Interpret a raw telemetry flag such as True, "true" or 1"""
+	return str(value).lower() in _TRUE_STRINGS
+
+def _float_or_none(value: Any) -> float | None:
+	"""Convert a raw telemetry value to float, passing None through"""
+	if value is None:
+		return None
+	return float(value)
+
+@dataclass(slots=True)
+class RinnaiTelemetry:
+	"""Values parsed once from a single Rinnai device poll"""
+
+	device_name: str
+	model: str
+	firmware_version: str
+	thing_name: str
+	user_uuid: str
+	serial_number: str
+	last_known_state: str | None
+	current_temperature: float | None
+	target_temperature: float | None
+	is_heating: bool
+	is_on: bool
+	is_recirculating: bool
+	outlet_temperature: float | None
+	inlet_temperature: float | None
+	vacation_mode_on: bool | None
+	water_flow_rate: float | None
+	combustion_cycles: float | None
+	operation_hours: float | None
+	pump_hours: float | None
+	fan_current: float | None
+	fan_frequency: float | None
+	pump_cycles: float | None
+
+	@classmethod
+	def from_device(cls, device: dict[str, Any]) -> RinnaiTelemetry:
+		"""Build a snapshot from the getDevice payload"""
+		info = device["info"]
+		shadow = device["shadow"]
+		schedule_holiday = shadow["schedule_holiday"]
+		return cls(
+			device_name=device["device_name"],
+			model=device["model"],
+			firmware_version=device["firmware"],
+			thing_name=device["thing_name"],
+			user_uuid=device["user_uuid"],
+			serial_number=info["serial_id"],
+			last_known_state=(device["activity"] or {}).get("eventType"),
+			current_temperature=_float_or_none(info["domestic_temperature"]),
+			target_temperature=_float_or_none(shadow["set_domestic_temperature"]),
+			is_heating=_as_bool(info["domestic_combustion"]),
+			is_on=shadow["set_operation_enabled"],
+			is_recirculating=_as_bool(shadow["recirculation_enabled"]),
+			outlet_temperature=_float_or_none(info["m02_outlet_temperature"]),
+			inlet_temperature=_float_or_none(info["m08_inlet_temperature"]),
+			vacation_mode_on=None if schedule_holiday is None else _as_bool(schedule_holiday),
+			water_flow_rate=_float_or_none(info["m01_water_flow_rate_raw"]),
+			combustion_cycles=_float_or_none(info["m04_combustion_cycles"]),
+			operation_hours=_float_or_none(info["operation_hours"]),
+			pump_hours=_float_or_none(info["m19_pump_hours"]),
+			fan_current=_float_or_none(info["m09_fan_current"]),
+			fan_frequency=_float_or_none(info["m05_fan_frequency"]),
+			pump_cycles=_float_or_none(info["m20_pump_cycles"]),
+		)
 
 class RinnaiDeviceDataUpdateCoordinator(DataUpdateCoordinator):
 	"""Rinnai device object"""
 
 	def __init__(
-		self, hass: HomeAssistant, api_client: API, device_id: str, options
+		self, hass: HomeAssistant, api_client: API, device_id: str, options,
+		token_lock: asyncio.Lock,
 	):
 		"""Initialize the device"""
 		self.hass: HomeAssistantType = hass
 		self.api_client: API = api_client
+		self._token_lock = token_lock
 		self._rinnai_device_id: str = device_id
 		self._manufacturer: str = "Rinnai"
 		self._device_information: Optional[Dict[str, Any]] | None = None
 		self.options = options
+		self._maint_interval: float = MIN_TIME_BETWEEN_UPDATES.total_seconds()
+		self._next_maintenance_retrieval: float = hass.loop.time()
 		super().__init__(
 			hass,
 			LOGGER,
 			name=f"{RINNAI_DOMAIN}-{device_id}",
-			update_interval=timedelta(seconds=60),
+			update_interval=UPDATE_INTERVAL,
+			always_update=False,
+			request_refresh_debouncer=Debouncer(
+				hass, LOGGER, cooldown=COMMAND_REFRESH_COOLDOWN, immediate=False
+			),
 		)
+		if not self.maint_interval_enabled:
+			LOGGER.debug("Skipping Maintenance retrieval for %s since disabled inside of configuration", device_id)
 
 	async def _async_update_data(self):
 		"""Update data via library"""
-		try:
-			async with timeout(10):
-				await asyncio.gather(
-					*[self._update_device()]
-				)
-		except (RequestError) as error:
-			raise UpdateFailed(error) from error
+		async with _POLL_SEMAPHORE:
+			try:
+				# The renewal is a full Cognito login, so it counts against
+				# the poll's deadline like any other request
+				async with timeout(10):
+					await _async_ensure_token(self.api_client, self._token_lock)
+					await self._update_device()
+			except (RequestError) as error:
+				raise UpdateFailed(error) from error
+		return RinnaiTelemetry.from_device(self._device_information["data"]["getDevice"])
 	
 	@property
 	def id(self) -> str:
 		"""Return Rinnai thing name"""
 		return self._rinnai_device_id
 
+	@cached_property
+	def maint_interval_enabled(self) -> bool:
+		"""Return whether scheduled maintenance retrieval is enabled.
+
+		Options changes reload the config entry, which builds a new
+		coordinator, so the cached value never goes stale.
+		"""
+		return self.options.get(CONF_MAINT_INTERVAL_ENABLED, DEFAULT_MAINT_INTERVAL_ENABLED)
+
 	@property
 	def device_name(self) -> str:
 		"""Return device name."""
-		return self._device_information["data"]["getDevice"]["device_name"]
+		return self.data.device_name
 
 	@property
 	def manufacturer(self) -> str:
@@ -71,154 +186,163 @@ class RinnaiDeviceDataUpdateCoordinator(DataUpdateCoordinator):
 	@property
 	def model(self) -> str:
 		"""Return model for device"""
-		return self._device_information["data"]["getDevice"]["model"]
-		
+		return self.data.model
+
 	@property
 	def firmware_version(self) -> str:
 		"""Return the serial number for the device"""
-		return self._device_information["data"]["getDevice"]["firmware"]
+		return self.data.firmware_version
 
 	@property
 	def thing_name(self) -> str:
 		"""Return model for device"""
-		return self._device_information["data"]["getDevice"]["thing_name"]
+		return self.data.thing_name
 
 	@property
 	def user_uuid(self) -> str:
 		"""Return model for device"""
-		return self._device_information["data"]["getDevice"]["user_uuid"]
+		return self.data.user_uuid
 
 	@property
 	def current_temperature(self) -> float:
 		"""Return the current temperature in degrees F"""
-		return float(self._device_information["data"]["getDevice"]["info"]["domestic_temperature"])
+		return self.data.current_temperature
 
 	@property
 	def target_temperature(self) -> float:
 		"""Return the current temperature in degrees F"""
-		if self._device_information["data"]["getDevice"]["shadow"]["set_domestic_temperature"] is None:
-			return None
-		return float(self._device_information["data"]["getDevice"]["shadow"]["set_domestic_temperature"])
+		return self.data.target_temperature
 
 	@property
 	def serial_number(self) -> str:
 		"""Return the serial number for the device"""
-		return self._device_information["data"]["getDevice"]["info"]["serial_id"]
+		return self.data.serial_number
 
 	@property
 	def last_known_state(self) -> str:
-		return self._device_information["data"]["getDevice"]["activity"]["eventType"]
+		return self.data.last_known_state
 
 	@property
 	def is_heating(self) -> bool:
-		return strtobool(str(self._device_information["data"]["getDevice"]["info"]["domestic_combustion"]))
+		return self.data.is_heating
 
 	@property
 	def is_on(self) -> bool:
-		return self._device_information["data"]["getDevice"]["shadow"]["set_operation_enabled"]
+		return self.data.is_on
 
 	@property
 	def is_recirculating(self) -> bool:
-		return strtobool(str(self._device_information["data"]["getDevice"]["shadow"]["recirculation_enabled"]))
+		return self.data.is_recirculating
 
 	@property
 	def outlet_temperature(self) -> float:
-		return float(self._device_information["data"]["getDevice"]["info"]["m02_outlet_temperature"])
+		return self.data.outlet_temperature
 
 	@property
 	def inlet_temperature(self) -> float:
-		return float(self._device_information["data"]["getDevice"]["info"]["m08_inlet_temperature"])
+		return self.data.inlet_temperature
 
 	@property
 	def vacation_mode_on(self) -> bool:
-		if self._device_information["data"]["getDevice"]["shadow"]["schedule_holiday"] is None:
-			return None
-		return strtobool(str(self._device_information["data"]["getDevice"]["shadow"]["schedule_holiday"]))
+		return self.data.vacation_mode_on
 
 	@property
 	def water_flow_rate(self) -> float:
-		"""Return the current temperature in degrees F"""
-		if int(self._device_information["data"]["getDevice"]["info"]["m01_water_flow_rate_raw"]) is None:
-			return None
-		return float(self._device_information["data"]["getDevice"]["info"]["m01_water_flow_rate_raw"])
+		return self.data.water_flow_rate
 
 	@property
 	def combustion_cycles(self) -> float:
-		"""Return the current temperature in degrees F"""
-		if self._device_information["data"]["getDevice"]["info"]["m04_combustion_cycles"] is None:
-			return None
-		return float(self._device_information["data"]["getDevice"]["info"]["m04_combustion_cycles"])
+		return self.data.combustion_cycles
 
 	@property
 	def operation_hours(self) -> float:
-		"""Return the current temperature in degrees F"""
-		if self._device_information["data"]["getDevice"]["info"]["operation_hours"] is None:
-			return None
-		return float(self._device_information["data"]["getDevice"]["info"]["operation_hours"])
+		return self.data.operation_hours
 
 	@property
 	def pump_hours(self) -> float:
-		"""Return the current temperature in degrees F"""
-		if self._device_information["data"]["getDevice"]["info"]["m19_pump_hours"] is None:
-			return None
-		return float(self._device_information["data"]["getDevice"]["info"]["m19_pump_hours"])
+		return self.data.pump_hours
 
 	@property
 	def fan_current(self) -> float:
-		"""Return the current temperature in degrees F"""
-		if self._device_information["data"]["getDevice"]["info"]["m09_fan_current"] is None:
-			return None
-		return float(self._device_information["data"]["getDevice"]["info"]["m09_fan_current"])
+		return self.data.fan_current
 
 	@property
 	def fan_frequency(self) -> float:
-		"""Return the current temperature in degrees F"""
-		if self._device_information["data"]["getDevice"]["info"]["m05_fan_frequency"] is None:
-			return None
-		return float(self._device_information["data"]["getDevice"]["info"]["m05_fan_frequency"])
+		return self.data.fan_frequency
 
 	@property
 	def pump_cycles(self) -> float:
-		"""Return the current temperature in degrees F"""
-		if self._device_information["data"]["getDevice"]["info"]["m20_pump_cycles"] is None:
-			return None
-		return float(self._device_information["data"]["getDevice"]["info"]["m20_pump_cycles"])
+		return self.data.pump_cycles
+
+	@callback
+	def async_seed(self, device: dict[str, Any]) -> None:
+		"""Use a device from the user listing as the first poll result"""
+		self._device_information = {"data": {"getDevice": device}}
+		self.async_set_updated_data(RinnaiTelemetry.from_device(device))
+
+	@callback
+	def _async_set_optimistic(self, **changes: Any) -> None:
+		"""Push the state a command is expected to produce without polling"""
+		if self.data is None:
+			return
+		data = replace(self.data, **changes)
+		if data != self.data:
+			self.async_set_updated_data(data)
+
+	async def _async_command_sent(self, **changes: Any) -> None:
+		"""Show a command's expected result now and confirm it with a poll"""
+		self._async_set_optimistic(**changes)
+		await self.async_request_refresh()
 
 	async def async_set_temperature(self, temperature: int):
 		await self.api_client.device.set_temperature(self._device_information["data"]["getDevice"], temperature)
+		await self._async_command_sent(target_temperature=float(temperature))
 
 	async def async_start_recirculation(self, duration: int):
 		await self.api_client.device.start_recirculation(self._device_information["data"]["getDevice"], duration)
+		await self._async_command_sent(is_recirculating=True)
 
 	async def async_stop_recirculation(self):
 		await self.api_client.device.stop_recirculation(self._device_information["data"]["getDevice"])
+		await self._async_command_sent(is_recirculating=False)
 
 	async def async_enable_vacation_mode(self):
 		await self.api_client.device.enable_vacation_mode(self._device_information["data"]["getDevice"])
+		await self._async_command_sent(vacation_mode_on=True)
 
 	async def async_disable_vacation_mode(self):
 		await self.api_client.device.disable_vacation_mode(self._device_information["data"]["getDevice"])
+		await self._async_command_sent(vacation_mode_on=False)
 
 	async def async_turn_off(self):
 		await self.api_client.device.turn_off(self._device_information["data"]["getDevice"])
+		await self._async_command_sent(is_on=False)
 
 	async def async_turn_on(self):
 		await self.api_client.device.turn_on(self._device_information["data"]["getDevice"])
+		await self._async_command_sent(is_on=True)
 
-	@Throttle(MIN_TIME_BETWEEN_UPDATES)
 	async def async_do_maintenance_retrieval(self):
+		now = self.hass.loop.time()
+		if now < self._next_maintenance_retrieval:
+			return
+		self._next_maintenance_retrieval = now + self._maint_interval
 		await self.api_client.device.do_maintenance_retrieval(self._device_information["data"]["getDevice"])
 		LOGGER.debug("Rinnai Maintenance Retrieval Started")
 
 	async def _update_device(self, *_) -> None:
 		"""Update the device information from the API"""
-		self._device_information = await self.api_client.device.get_info(
-			self._rinnai_device_id
-		)
-
-		if self.options[CONF_MAINT_INTERVAL_ENABLED]:
-			await self.async_do_maintenance_retrieval()
+		if self.maint_interval_enabled:
+			# The retrieval request only needs the device identity from the
+			# seed or the previous poll, so it can share the round trip with
+			# get_info.
+			self._device_information, _ = await asyncio.gather(
+				self.api_client.device.get_info(self._rinnai_device_id),
+				self.async_do_maintenance_retrieval(),
+			)
 		else:
-			LOGGER.debug("Skipping Maintenance retrieval since disabled inside of configuration")
-		
+			self._device_information = await self.api_client.device.get_info(
+				self._rinnai_device_id
+			)
+
 		LOGGER.debug("Rinnai device data: %s", self._device_information)
\ No newline at end of file
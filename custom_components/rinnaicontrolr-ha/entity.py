@@ -1,49 +1,59 @@
 """Base entity class for Flo entities."""
 from __future__ import annotations
 
-from typing import Any
-
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
-from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN as RINNAI_DOMAIN
 from .device import RinnaiDeviceDataUpdateCoordinator
 
-class RinnaiEntity(Entity):
+class RinnaiEntity(CoordinatorEntity[RinnaiDeviceDataUpdateCoordinator]):
     """A base class for Rinnai entities."""
 
     _attr_force_update = False
-    _attr_should_poll = True
-    
+
+    _written_available: bool | None = None
+
     def __init__(
         self,
         entity_type: str,
-        name: str,
-        device: RinnaiDeviceUpdateCoordinator,
+        name: str | None,
+        device: RinnaiDeviceDataUpdateCoordinator,
         **kwargs,
     ) -> None:
         """Init Rinnai entity."""
-        self._attr_name = name
+        super().__init__(device)
+        if name is not None:
+            self._attr_name = name
         self._attr_unique_id = f"{device.id}_{entity_type}"
 
-        self._device: RinnaiDeviceDataUpdateCoordinator = device
-        self._state: Any = None
-
     @property
     def device_info(self) -> DeviceInfo:
         """Return a device description for device registry."""
         return DeviceInfo(
-            identifiers={(RINNAI_DOMAIN, self._device.id)},
-            manufacturer=self._device.manufacturer,
-            model=self._device.model,
-            name=self._device.device_name,
-            sw_version=self._device.firmware_version,
+            identifiers={(RINNAI_DOMAIN, self.coordinator.id)},
+            manufacturer=self.coordinator.manufacturer,
+            model=self.coordinator.model,
+            name=self.coordinator.device_name,
+            sw_version=self.coordinator.firmware_version,
         )
-    
-    async def async_update(self):
-        """Update Rinnai entity."""
-        await self._device.async_request_refresh()
-
-    async def async_added_to_hass(self):
-        """When entity is added to hass"""
-        self.async_on_remove(self._device.async_add_listener(self.async_write_ha_state))
\ No newline at end of file
+
+    async def async_update(self) -> None:
+        """Refresh right away when an entity update is requested.
+
+        Requested refreshes are debounced to confirm commands, which would
+        otherwise delay homeassistant.update_entity by the cooldown.
+        """
+        if not self.enabled:
+            return
+        await self.coordinator.async_refresh()
+
+    @callback
+    def _async_write_if_changed(self, changed: bool) -> None:
+        """Write state when the value or the coordinator's availability changed."""
+        available = self.available
+        if changed or available != self._written_available:
+            self._written_available = available
+            self.async_write_ha_state()
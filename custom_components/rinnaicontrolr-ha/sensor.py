@@ -1,16 +1,21 @@
 """Support for Rinnai Water Heater Monitor sensors."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+
 from homeassistant.const import (
     UnitOfTemperature,
     UnitOfElectricCurrent,
     UnitOfFrequency,
 )
 
+from homeassistant.core import callback
 from homeassistant.components.sensor import (
     SensorStateClass,
     SensorDeviceClass,
-    SensorEntity
+    SensorEntity,
+    SensorEntityDescription,
 )
 
 from .const import DOMAIN as RINNAI_DOMAIN, CONF_UNIT
@@ -25,236 +30,131 @@ PUMP_CYCLES_ICON = "mdi:heat-pump-outline"
 FAN_CURRENT_ICON = "mdi:fan-auto"
 FAN_FREQUENCY_ICON = "mdi:fan-chevron-up"
 
+@dataclass(frozen=True, kw_only=True)
+class RinnaiSensorEntityDescription(SensorEntityDescription):
+    """Describes a Rinnai sensor."""
+
+    value_fn: Callable[[RinnaiDeviceDataUpdateCoordinator], float | None]
+    divisor: int = 1
+
+SENSOR_TYPES: tuple[RinnaiSensorEntityDescription, ...] = (
+    RinnaiSensorEntityDescription(
+        key="outlet_temperature",
+        translation_key="outlet_temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        value_fn=lambda device: device.outlet_temperature,
+    ),
+    RinnaiSensorEntityDescription(
+        key="inlet_temperature",
+        translation_key="inlet_temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        value_fn=lambda device: device.inlet_temperature,
+    ),
+    RinnaiSensorEntityDescription(
+        key="water_flow_rate",
+        translation_key="water_flow_rate",
+        icon=GAUGE_ICON,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        native_unit_of_measurement="gpm",
+        value_fn=lambda device: device.water_flow_rate,
+        divisor=10,
+    ),
+    RinnaiSensorEntityDescription(
+        key="combustion_cycles",
+        translation_key="combustion_cycles",
+        icon=COMBUSTION_ICON,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        native_unit_of_measurement="cycles",
+        value_fn=lambda device: device.combustion_cycles,
+    ),
+    RinnaiSensorEntityDescription(
+        key="operation_hours",
+        translation_key="operation_hours",
+        icon=OPERATION_ICON,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda device: device.operation_hours,
+    ),
+    RinnaiSensorEntityDescription(
+        key="pump_hours",
+        translation_key="pump_hours",
+        icon=PUMP_ICON,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda device: device.pump_hours,
+    ),
+    RinnaiSensorEntityDescription(
+        key="pump_cycles",
+        translation_key="pump_cycles",
+        icon=PUMP_CYCLES_ICON,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        native_unit_of_measurement="cycles",
+        value_fn=lambda device: device.pump_cycles,
+    ),
+    RinnaiSensorEntityDescription(
+        key="fan_current",
+        translation_key="fan_current",
+        icon=FAN_CURRENT_ICON,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+        value_fn=lambda device: device.fan_current,
+    ),
+    RinnaiSensorEntityDescription(
+        key="fan_frequency",
+        translation_key="fan_frequency",
+        icon=FAN_FREQUENCY_ICON,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        value_fn=lambda device: device.fan_frequency,
+    ),
+)
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the Rinnai sensors from config entry."""
     devices: list[RinnaiDeviceDataUpdateCoordinator] = hass.data[RINNAI_DOMAIN][
         config_entry.entry_id
     ]["devices"]
-    entities = []
-    for device in devices:
-        entities.extend(
-            [
-                RinnaiOutletTemperatureSensor(device),
-                RinnaiInletTemperatureSensor(device),
-                RinnaiWaterFlowRateSensor(device),
-                RinnaiCombustionCyclesSensor(device),
-                RinnaiOperationHoursSensor(device),
-                RinnaiPumpHoursSensor(device),
-                RinnaiPumpCyclesSensor(device),
-                RinnaiFanCurrentSensor(device),
-                RinnaiFanFrequencySensor(device),
-            ]
-        )
-    async_add_entities(entities)
-
-class RinnaiOutletTemperatureSensor(RinnaiEntity, SensorEntity):
-    """Monitors the temperature."""
-
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("outlet_temperature", f"{device.device_name} Outlet Temperature", device)
-        self._state: float = None
-
-    @property
-    def device_class(self):
-        """Return the device class of the sensor."""
-        return SensorDeviceClass.TEMPERATURE
-
-    @property
-    def state_class(self):
-        """Return the state class of the sensor."""
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        return UnitOfTemperature.FAHRENHEIT
-
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.outlet_temperature is None:
-            return None
-        return round(self._device.outlet_temperature, 1)
-
-class RinnaiInletTemperatureSensor(RinnaiEntity, SensorEntity):
-    """Monitors the temperature."""
-
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("inlet_temperature", f"{device.device_name} Inlet Temperature", device)
-        self._state: float = None
-
-    @property
-    def device_class(self):
-        """Return the device class of the sensor."""
-        return SensorDeviceClass.TEMPERATURE
-
-    @property
-    def state_class(self):
-        """Return the state class of the sensor."""
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        return UnitOfTemperature.FAHRENHEIT
-
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.inlet_temperature is None:
-            return None
-        return round(self._device.inlet_temperature, 1)
-
-class RinnaiWaterFlowRateSensor(RinnaiEntity, SensorEntity):
-    """Monitors the water flow rate."""
-
-    _attr_icon = GAUGE_ICON
-    _attr_native_unit_of_measurement = "gpm"
-    _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
-
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("water_flow_rate", f"{device.device_name} Water Flow Rate", device)
-        self._state: float = None
-
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.water_flow_rate is None:
-            return None
-        return round(self._device.water_flow_rate * 0.1, 1)
-
-class RinnaiCombustionCyclesSensor(RinnaiEntity, SensorEntity):
-    """Monitors the combustion cycles."""
-
-    _attr_icon = COMBUSTION_ICON
-    _attr_native_unit_of_measurement = "cycles"
-    _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
-
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("combustion_cycles", f"{device.device_name} Combustion Cycles x100", device)
-        self._state: float = None
-
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.combustion_cycles is None:
-            return None
-        return round(self._device.combustion_cycles, 1)
-
-class RinnaiOperationHoursSensor(RinnaiEntity, SensorEntity):
-    """Monitors the operation hours."""
-
-    _attr_icon = OPERATION_ICON
-
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("operation_hours", f"{device.device_name} Operation Hours x100", device)
-        self._state: float = None
-
-    @property
-    def state_class(self):
-        """Return the state class of the sensor."""
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.operation_hours is None:
-            return None
-        return round(self._device.operation_hours, 1)
-
-class RinnaiPumpHoursSensor(RinnaiEntity, SensorEntity):
-    """Monitors the pump hours."""
-
-    _attr_icon = PUMP_ICON
-
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("pump_hours", f"{device.device_name} Pump Hours x100", device)
-        self._state: float = None
-
-    @property
-    def state_class(self):
-        """Return the state class of the sensor."""
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.pump_hours is None:
-            return None
-        return round(self._device.pump_hours, 1)
-
-class RinnaiPumpCyclesSensor(RinnaiEntity, SensorEntity):
-    """Monitors the pump cycles."""
-
-    _attr_icon = PUMP_CYCLES_ICON
-    _attr_native_unit_of_measurement = "cycles"
-    _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
-
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("pump_cycles", f"{device.device_name} Pump Cycles x100", device)
-        self._state: float = None
-
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.pump_cycles is None:
-            return None
-        return round(self._device.pump_cycles, 1)
-
-class RinnaiFanCurrentSensor(RinnaiEntity, SensorEntity):
-    """Monitors the fan current."""
-
-    _attr_icon = FAN_CURRENT_ICON
-
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("fan_current", f"{device.device_name} Fan Current x10", device)
-        self._state: float = None
-
-    @property
-    def state_class(self):
-        """Return the state class of the sensor."""
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        return UnitOfElectricCurrent.MILLIAMPERE
-
-
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.fan_current is None:
-            return None
-        return round(self._device.fan_current, 1)
-
-class RinnaiFanFrequencySensor(RinnaiEntity, SensorEntity):
-    """Monitors the fan frequency"""
+    async_add_entities(
+        RinnaiSensor(device, description)
+        for device in devices
+        for description in SENSOR_TYPES
+    )
 
-    _attr_icon = FAN_FREQUENCY_ICON
+class RinnaiSensor(RinnaiEntity, SensorEntity):
+    """Monitors a single Rinnai telemetry value."""
 
-    def __init__(self, device):
-        """Initialize the temperature sensor."""
-        super().__init__("fan_frequency", f"{device.device_name} Fan Frequency", device)
-        self._state: float = None
+    _attr_has_entity_name = True
 
-    @property
-    def state_class(self):
-        """Return the state class of the sensor."""
-        return SensorStateClass.MEASUREMENT
+    entity_description: RinnaiSensorEntityDescription
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        return UnitOfFrequency.HERTZ
+    def __init__(self, device, description: RinnaiSensorEntityDescription):
+        """Initialize the sensor."""
+        super().__init__(description.key, None, device)
+        self.entity_description = description
+        self._attr_native_value = self._compute_value()
 
-    @property
-    def native_value(self):
-        """Return the current temperature."""
-        if self._device.fan_frequency is None:
+    def _compute_value(self) -> float | None:
+        """Return the current value from the device snapshot."""
+        value = self.entity_description.value_fn(self.coordinator)
+        if value is None:
             return None
-        return round(self._device.fan_frequency, 1)
\ No newline at end of file
+        return value / self.entity_description.divisor
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when this sensor's value changed."""
+        value = self._compute_value()
+        changed = value != self._attr_native_value
+        self._attr_native_value = value
+        self._async_write_if_changed(changed)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import voluptuous as vol
 
 from homeassistant.components.water_heater import WaterHeaterEntity, WaterHeaterEntityFeature, ATTR_TEMPERATURE, STATE_GAS, STATE_OFF, STATE_ON
+from homeassistant.core import callback
 from homeassistant.helpers import entity_platform
 from homeassistant.util.unit_system import METRIC_SYSTEM
 from homeassistant.const import (
@@ -29,10 +30,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     devices: list[RinnaiDeviceDataUpdateCoordinator] = hass.data[RINNAI_DOMAIN][
         config_entry.entry_id
     ]["devices"]
-    entities = []
-    for device in devices:
-        entities.append(RinnaiWaterHeater(device))
-    async_add_entities(entities)
+    async_add_entities(RinnaiWaterHeater(device) for device in devices)
 
     platform = entity_platform.async_get_current_platform()
 
@@ -51,98 +49,73 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 class RinnaiWaterHeater(RinnaiEntity, WaterHeaterEntity):
     """Water Heater entity for a Rinnai Device"""
 
+    _attr_icon = "mdi:water-boiler"
     _attr_operation_list = OPERATION_LIST
+    _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+    _attr_min_temp = 110.0
+    _attr_max_temp = 140.0
     _attr_supported_features = (WaterHeaterEntityFeature.AWAY_MODE | WaterHeaterEntityFeature.OPERATION_MODE | WaterHeaterEntityFeature.TARGET_TEMPERATURE)
 
     def __init__(self, device: RinnaiDeviceDataUpdateCoordinator) -> None:
         """Initialize the water heater."""
         super().__init__("water_heater", f"{device.device_name} Water Heater", device)
 
-    @property
-    def current_operation(self):
-        """Return current operation"""
-        if self._device.is_heating:
-            return STATE_GAS
-        elif self._device.is_on:
-            return STATE_IDLE
-        else:
-            return STATE_OFF
-
-    @property
-    def icon(self):
-        """Return the icon to use for the valve."""
-        return "mdi:water-boiler"
-
-    @property
-    def temperature_unit(self):
-        return UnitOfTemperature.FAHRENHEIT
-
-    @property
-    def min_temp(self):
-        return float(110)
-
-    @property
-    def max_temp(self):
-        return float(140)
-
-    @property
-    def target_temperature(self):
-        """Return the temperature we try to reach"""
-        return self._device.target_temperature
-
-    @property
-    def is_away_mode_on(self):
-        return self._device.vacation_mode_on
-
-    @property
-    def outlet_temperature(self):
-        if self.hass.config.units is METRIC_SYSTEM:
-            return round((self._device.outlet_temperature-32)/1.8, 1)
-        return round(self._device.outlet_temperature, 1)
-
-    @property
-    def inlet_temperature(self):
+    def _display_temperature(self, value: float | None) -> float | None:
+        """Convert a Fahrenheit reading to the configured unit system"""
+        if value is None:
+            return None
         if self.hass.config.units is METRIC_SYSTEM:
-            return round((self._device.inlet_temperature-32)/1.8, 1)
-        return round(self._device.inlet_temperature, 1)
-
-    @property
-    def current_temperature(self):
-        """REturn the current temperature."""
-        return self._device.current_temperature
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the optional device state attributes."""
-        return {
+            return round((value-32)/1.8, 1)
+        return round(value, 1)
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Cache the entity state from the device's latest snapshot."""
+        data = self.coordinator.data
+        if data.is_heating:
+            self._attr_current_operation = STATE_GAS
+        elif data.is_on:
+            self._attr_current_operation = STATE_IDLE
+        else:
+            self._attr_current_operation = STATE_OFF
+        self._attr_target_temperature = data.target_temperature
+        self._attr_current_temperature = data.current_temperature
+        self._attr_is_away_mode_on = data.vacation_mode_on
+        self._attr_extra_state_attributes = {
             "target_temp_step": 5,
-            "outlet_temperature": self.outlet_temperature,
-            "inlet_temperature": self.inlet_temperature
+            "outlet_temperature": self._display_temperature(data.outlet_temperature),
+            "inlet_temperature": self._display_temperature(data.inlet_temperature),
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state before writing it."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
     async def async_set_temperature(self, **kwargs):
         target_temp = kwargs.get(ATTR_TEMPERATURE)
         if target_temp is not None:
-            await self._device.async_set_temperature(int(target_temp))
+            await self.coordinator.async_set_temperature(int(target_temp))
             LOGGER.debug("Updated temperature to: %s", target_temp)
         else:
             LOGGER.error("A target temperature must be provided")
 
     async def async_turn_away_mode_on(self) -> None:
         """Turn away mode on."""
-        await self._device.async_enable_vacation_mode()
+        await self.coordinator.async_enable_vacation_mode()
 
     async def async_turn_away_mode_off(self) -> None:
         """Turn away mode off."""
-        await self._device.async_disable_vacation_mode()
+        await self.coordinator.async_disable_vacation_mode()
 
     async def async_set_operation_mode(self, operation_mode):
         if operation_mode == STATE_ON:
-            await self._device.async_turn_on()
+            await self.coordinator.async_turn_on()
         elif operation_mode == STATE_GAS:
-            await self._device.async_turn_on()
+            await self.coordinator.async_turn_on()
         else: #STATE OFF
-            await self._device.async_turn_off()
+            await self.coordinator.async_turn_off()
 
     async def async_turn_on(self):
         """Turn on."""
@@ -153,13 +126,12 @@ class RinnaiWaterHeater(RinnaiEntity, WaterHeaterEntity):
         await self.async_set_operation_mode(STATE_OFF)
 
     async def async_start_recirculation(self, recirculation_minutes = 5):
-        await self._device.async_start_recirculation(recirculation_minutes)
-        self.async_write_ha_state()
+        await self.coordinator.async_start_recirculation(recirculation_minutes)
 
     async def async_stop_recirculation(self):
-        await self._device.async_stop_recirculation()
-        self.async_write_ha_state()
+        await self.coordinator.async_stop_recirculation()
 
     async def async_added_to_hass(self):
         """When entity is added to hass."""
+        self._async_update_attrs()
         await super().async_added_to_hass()